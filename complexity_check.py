@@ -0,0 +1,545 @@
+# Complexity Check
+# Reads the "Time: O(...)" / "Space: O(...)" header of every solver, runs it on inputs of
+# doubling size, and flags solvers whose measured growth outpaces the declared bound.
+#
+# For each size we divide the measured time (and traced peak allocation) by the declared
+# bound evaluated at that size, then ask whether that ratio is better explained by a constant
+# (the bound holds) or by a power of log n (the bound is missing a log factor or worse).
+# The default range 2^8..2^20 is wide enough for log n to grow 2.5x, well clear of jitter.
+# Columns: fit = measured ~ n^fit, log^b = ratio ~ (log n)^b, tail = b over the upper half
+# of the sizes (space only), gain = how many times smaller the log model's residual is than
+# the constant's.
+# Bounds with a size-dependent exponent (n^(target/min)) are reported as n/c, not checkable.
+#
+# Flags listed in KNOWN_ISSUES are reported but don't fail the run (--strict ignores the list);
+# anything else exits 1. So does an ERROR: an annotated solver with no generator in SPECS, one
+# that runs out of --budget before 4 sizes, or one doing more than --max-steps loop steps per
+# unit of its declared bound, which catches blow-ups too slow to time at all.
+#
+# Usage:
+#   python complexity_check.py
+#   python complexity_check.py --file answers_pythonic.py
+#   python complexity_check.py --solvers topKFrequent threeSum --max-size 65536
+#   python complexity_check.py --strict --passes 5
+import argparse
+import gc
+import math
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from statistics import linear_regression
+
+from solvers import HERE, load_headers, load_solvers
+
+
+# Annotation Parsing
+# "O(n + k) = O(n)" -> "v_n", "O(n * k log k)" -> "v_n*v_k*log(v_k)", "O(n²)" -> "v_n**2"
+# Variables are prefixed so a variable named like a function (`min` in "target/min") still works.
+FUNCTIONS = {"log", "min", "max", "sqrt"}
+TOKEN = re.compile(r"\d+(?:\.\d+)?|[A-Za-z_][A-Za-z0-9_]*|\*\*|[-+*/^(),]")
+
+
+def extract_bound(header: str, label: str):
+    # Last O(...) in the clause after "label:", up to "|" or the end of the line
+    match = re.search(rf"{label}:([^|\n]*)", header)
+    if not match:
+        return None
+
+    clause = match.group(1)
+    bounds = []
+    start = clause.find("O(")
+    while start != -1:
+        depth = 0
+        for end in range(start + 1, len(clause)):
+            depth += {"(": 1, ")": -1}.get(clause[end], 0)
+            if depth == 0:
+                bounds.append(clause[start + 2:end])
+                break
+        start = clause.find("O(", start + 2)
+
+    return bounds[-1] if bounds else None
+
+
+def to_python(bound: str) -> str:
+    tokens = TOKEN.findall(bound.replace("²", "^2"))
+    out = []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        is_function = token in FUNCTIONS and i + 1 < len(tokens) and tokens[i + 1] == "("
+
+        # Implicit multiplication: "n log n", "2n", ") ("
+        follows_operand = out and (out[-1][-1].isalnum() or out[-1][-1] == ")") and out[-1] not in FUNCTIONS
+        if follows_operand and (token[0].isalnum() or token == "("):
+            out.append("*")
+
+        if token == "^":
+            out.append("**")
+        elif token == "log" and not is_function:
+            # "log k" -> "log(v_k)"
+            i += 1
+            out.append(f"log(v_{tokens[i]})" if tokens[i][0].isalpha() else f"log({tokens[i]})")
+        elif is_function:
+            out.append(token)
+        elif token[0].isalpha() or token[0] == "_":
+            out.append(f"v_{token}")
+        else:
+            out.append(token)
+        i += 1
+
+    return "".join(out)
+
+
+def evaluate(expression: str, bindings: dict) -> float:
+    namespace = {
+        "__builtins__": {},
+        "log": lambda x: max(1.0, math.log2(x)),  # Keep log factors >= 1 so small sizes don't divide by 0
+        "min": min,
+        "max": max,
+        "sqrt": math.sqrt,
+    }
+    namespace.update({f"v_{name}": value for name, value in bindings.items()})
+    return max(1.0, float(eval(expression, namespace)))
+
+
+# Input Generators
+# Each spec builds fresh arguments for a size and binds the annotation's variables for it.
+class TreeNode:
+    def __init__(self, val=0, left=None, right=None):
+        self.val = val
+        self.left = left
+        self.right = right
+
+
+class ListNode:
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+
+def balanced_tree(values: list):
+    # Complete binary tree in level order, height log n
+    nodes = [TreeNode(v) for v in values]
+    for i, node in enumerate(nodes):
+        if 2 * i + 1 < len(nodes):
+            node.left = nodes[2 * i + 1]
+        if 2 * i + 2 < len(nodes):
+            node.right = nodes[2 * i + 2]
+    return nodes[0] if nodes else None
+
+
+def linked_list(values: list, cycle: bool = False):
+    head = None
+    for v in reversed(values):
+        head = ListNode(v, head)
+    if cycle and head:
+        tail = head
+        while tail.next:
+            tail = tail.next
+        tail.next = head
+    return head
+
+
+def letters(rng, n: int, alphabet: str = "abcdefghijklmnopqrstuvwxyz") -> str:
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+
+def square(n: int) -> int:
+    return max(1, math.isqrt(n))
+
+
+class Spec:
+    def __init__(self, make_input, bind=None, sizes=None, excludes_output=False, mutates=False):
+        self.make_input = make_input  # (size, rng) -> tuple of arguments
+        self.bind = bind or (lambda n: {"n": n})  # size -> annotation variables
+        self.sizes = sizes  # Explicit sizes instead of doubling
+        self.excludes_output = excludes_output  # Space bound doesn't count the returned value
+        self.mutates = mutates  # Solver changes its input, so every call needs a fresh copy
+
+
+SPECS = {
+    # k grows with n so the first window can't hide an O(k) copy
+    "findMaxAverage": Spec(
+        lambda n, rng: ([rng.randint(-10_000, 10_000) for _ in range(n)], max(1, n // 2)),
+        bind=lambda n: {"n": n, "k": max(1, n // 2)}),
+    "longestOnes": Spec(lambda n, rng: ([rng.randint(0, 1) for _ in range(n)], n // 8)),
+    "runningSum": Spec(lambda n, rng: ([rng.randint(-100, 100) for _ in range(n)],)),
+    "minStartValue": Spec(lambda n, rng: ([rng.randint(-100, 100) for _ in range(n)],)),
+    "maxProfit": Spec(lambda n, rng: ([rng.randint(1, 10_000) for _ in range(n)],)),
+    "lengthOfLongestSubstring": Spec(
+        lambda n, rng: (letters(rng, n),),
+        bind=lambda n: {"n": n, "m": 26}),
+    "threeSum": Spec(
+        lambda n, rng: ([rng.randint(-n, n) for _ in range(n)],),
+        sizes=[2 ** i for i in range(6, 12)], excludes_output=True, mutates=True),
+    "minWindow": Spec(
+        lambda n, rng: (letters(rng, n), "abc"),
+        bind=lambda n: {"n": n, "m": 3}),
+    "merge": Spec(lambda n, rng: ([[s, s + rng.randint(0, 10)] for s in
+                                   (rng.randint(0, 10 * n) for _ in range(n))],), mutates=True),
+    "singleNumber": Spec(lambda n, rng: ([rng.randint(0, 2 ** 30) for _ in range(n)],)),
+    "groupAnagrams": Spec(
+        lambda n, rng: ([letters(rng, 8, "abcd") for _ in range(n)],),
+        bind=lambda n: {"n": n, "k": 8}),
+    # Distinct values pushed in descending order: every heappush sifts to the root
+    "topKFrequent": Spec(
+        lambda n, rng: (list(range(n, 0, -1)), 10),
+        bind=lambda n: {"n": n, "k": 10}),
+    "searchRange": Spec(lambda n, rng: (sorted(rng.randint(0, n) for _ in range(n)), rng.randint(0, n))),
+    "levelOrder": Spec(lambda n, rng: (balanced_tree(list(range(n))),)),
+    "numIslands": Spec(
+        lambda n, rng: ([[rng.choice("01") for _ in range(square(n))] for _ in range(square(n))],),
+        bind=lambda n: {"m": square(n), "n": square(n)}, mutates=True),
+    "maxPathSum": Spec(
+        lambda n, rng: (balanced_tree([rng.randint(-100, 100) for _ in range(n)]),),
+        bind=lambda n: {"n": n, "h": math.log2(n)}),
+    # All-'a' board and a word that never matches: every cell explores the full branch
+    "exist": Spec(
+        lambda n, rng: ([["a"] * square(n) for _ in range(square(n))], "aaab"),
+        bind=lambda n: {"m": square(n), "n": square(n), "L": 4}),
+    "climbStairs": Spec(lambda n, rng: (n,)),
+    "rob": Spec(lambda n, rng: ([rng.randint(0, 400) for _ in range(n)],)),
+    "combinationSum": Spec(
+        lambda n, rng: ([2, 3, 5, 7], n),
+        bind=lambda n: {"n": 4, "target": n, "min": 2},
+        sizes=list(range(8, 49, 8)), excludes_output=True),
+    "reverseList": Spec(lambda n, rng: (linked_list(list(range(n))),), mutates=True),
+    "hasCycle": Spec(lambda n, rng: (linked_list(list(range(n)), cycle=True),)),
+    "isValid": Spec(lambda n, rng: ("(" * (n // 2) + ")" * (n // 2),)),
+}
+
+
+# Measurement
+def measure_time(solver, spec: Spec, size: int, rng, repeats: int) -> float:
+    # Best per-call time over several runs, each long enough (~20ms) to time reliably.
+    # Solvers that mutate their input get a fresh one per call, the rest reuse one so
+    # cheap calls aren't dominated by cache misses on cold inputs.
+    # GC is off while timing, like timeit: a collection walks every live object in the
+    # process, so its cost depends on what earlier solvers left behind, not on this one.
+    args = spec.make_input(size, rng)
+    start = time.perf_counter()
+    solver(*args)
+    single = time.perf_counter() - start
+    number = max(1, min(1000, int(0.02 / max(single, 1e-7))))
+
+    best = float("inf")
+    for _ in range(repeats):
+        if spec.mutates:
+            inputs = [spec.make_input(size, rng) for _ in range(number)]
+        else:
+            inputs = [args] * number
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for args in inputs:
+                solver(*args)
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = min(best, elapsed / number)
+    return best
+
+
+def unit_cost() -> float:
+    # Seconds per iteration of a trivial interpreted loop, the yardstick for one "step"
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        total = 0
+        for i in range(100_000):
+            total += i
+        best = min(best, (time.perf_counter() - start) / 100_000)
+    return best
+
+
+def warm_up(solver, spec: Spec, size: int, rng, seconds: float = 0.2):
+    # The first calls in a fresh process run slow (cold caches, CPU clocking up), which
+    # would bend the fit at the small sizes we measure first
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        solver(*spec.make_input(size, rng))
+
+
+def measure_space(solver, spec: Spec, size: int, rng) -> int:
+    # Peak bytes allocated during the call. The input is built before tracing starts.
+    args = spec.make_input(size, rng)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        result = solver(*args)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    # "excluding output": the returned value is still alive in `after`, so take it back out
+    return peak - (after if spec.excludes_output else before)
+
+
+# Model Comparison
+# Two one-line models for ratio = measured / bound as a function of L = log2(n):
+#   constant:   log(ratio) = a                the declared bound holds
+#   log power:  log(ratio) = a + b * log(L)   ratio grows like (log n)^b
+# A missing log factor shows up as b near 1 with the log model explaining most of the
+# spread that the constant leaves. Jitter moves b around but doesn't fit log n, and constant
+# per-call overhead makes b negative. Polynomial excess fits with a much larger b.
+# Allocation sizes are deterministic but grow in one-off steps (a dict's index switching from
+# 2- to 4-byte slots at 2^15 entries), so space must also keep growing over the upper half of
+# the sizes. Time skips that test: over 2^14..2^20 log n barely moves and the tail slope is noise.
+MIN_LOG_POWER = 0.5  # At least half a log factor before we call it growth
+
+
+def log_fit(sizes: list, measured: list, bounds: list, floor: float = 0.0) -> tuple[float, float]:
+    # Returns (b, improvement) where improvement = residual(constant) / residual(log power)
+    xs = [math.log(math.log2(size)) for size in sizes]
+    ys = [math.log(max(value, floor, 1e-12) / bound) for value, bound in zip(measured, bounds)]
+
+    mean = sum(ys) / len(ys)
+    constant_rss = sum((y - mean) ** 2 for y in ys)
+    fit = linear_regression(xs, ys)
+    log_rss = sum((y - fit.intercept - fit.slope * x) ** 2 for x, y in zip(xs, ys))
+
+    return fit.slope, constant_rss / max(log_rss, 1e-12)
+
+
+def growth_exponent(sizes: list, measured: list, floor: float = 0.0) -> float:
+    # Fitted k in measured ~ size^k, reported for reference only
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(value, floor, 1e-12)) for value in measured]
+    return linear_regression(xs, ys).slope
+
+
+def exponent_variables(bound: str) -> set:
+    # Variables that appear in an exponent, e.g. {"target", "min"} for "n^(target/min)"
+    tokens = TOKEN.findall(bound.replace("²", "^2"))
+    names = set()
+    for i, token in enumerate(tokens):
+        if token not in ("^", "**") or i + 1 >= len(tokens):
+            continue
+        depth = 0
+        for follower in tokens[i + 1:]:
+            depth += {"(": 1, ")": -1}.get(follower, 0)
+            if follower[0].isalpha() and follower not in FUNCTIONS:
+                names.add(follower)
+            if depth <= 0:
+                break
+    return names
+
+
+# Flags that are already understood. They are still reported, but don't fail the run.
+KNOWN_ISSUES = {
+    ("answers.py", "climbStairs"): ({"time", "space"},
+                                    "Fibonacci numbers grow by ~0.7 bits per step, so big-int adds "
+                                    "cost O(n) each; O(n) / O(1) only holds for fixed-width ints"),
+    ("answers.py", "topKFrequent"): ({"time"},
+                                     "pushes all n counts onto the heap, so it is O(n log n), not O(n log k)"),
+    ("answers_pythonic.py", "findMaxAverage"): ({"space"},
+                                                "sum(nums[:k]) copies the first window, O(k) space"),
+}
+
+
+class Check:
+    # One metric (time or space) of one solver against its declared bound
+    def __init__(self, bound):
+        self.bound = bound
+        self.growth = None
+        self.log_power = None
+        self.improvement = None
+        self.tail_power = None  # b fitted on the upper half of the sizes only (space)
+        self.skipped = None
+
+    def flagged(self, margin: float) -> bool:
+        return (self.log_power is not None and self.log_power >= MIN_LOG_POWER
+                and self.improvement >= margin
+                and (self.tail_power is None or self.tail_power >= MIN_LOG_POWER))
+
+
+class Result:
+    def __init__(self, name, time_bound, space_bound, margin, known=None):
+        self.name = name
+        self.time = Check(time_bound)
+        self.space = Check(space_bound)
+        self.margin = margin
+        self.known, self.reason = known or (set(), None)
+        self.sizes = []
+        self.times = []
+        self.spaces = []
+        self.skipped = None
+        self.error = None  # Couldn't be checked but should have been, fails the run
+
+    @property
+    def flagged(self) -> list:
+        return [label for label, check in (("time", self.time), ("space", self.space))
+                if check.flagged(self.margin)]
+
+    @property
+    def unexpected(self) -> list:
+        return [label for label in self.flagged if label not in self.known]
+
+
+def analyse(check: Check, sizes: list, measured: list, bindings: list, floor: float = 0.0,
+            tail: bool = False):
+    if check.bound is None:
+        check.skipped = "no annotation"
+        return
+
+    check.growth = growth_exponent(sizes, measured, floor)
+
+    # A bound like 4^(target/2) outgrows anything we can time, so fitting it says nothing
+    varying = {name for name in exponent_variables(check.bound)
+               if len({b.get(name) for b in bindings}) > 1}
+    if varying:
+        check.skipped = "exponential bound, not checkable"
+        return
+
+    expression = to_python(check.bound)
+    bounds = [evaluate(expression, b) for b in bindings]
+    check.log_power, check.improvement = log_fit(sizes, measured, bounds, floor)
+
+    if tail:
+        half = len(sizes) // 2
+        check.tail_power, _ = log_fit(sizes[half:], measured[half:], bounds[half:], floor)
+
+
+def check_solver(name, solver, header, args, rng, known=None, unit=None) -> Result:
+    result = Result(name, extract_bound(header, "Time"), extract_bound(header, "Space"),
+                    args.margin, known)
+    spec = SPECS.get(name)
+
+    if result.time.bound is None and result.space.bound is None:
+        result.skipped = "no Time:/Space: annotation"
+        return result
+    if spec is None:
+        # Annotated but unchecked: coverage would quietly shrink as solvers are added
+        result.error = "no input generator in SPECS"
+        return result
+
+    sizes = spec.sizes or [2 ** i for i in range(args.min_exp, args.max_size.bit_length())]
+    warm_up(solver, spec, sizes[0], rng)
+
+    # First pass finds the sizes that fit in the budget, later passes re-time them in
+    # interleaved order and keep the best, so a slow moment only hurts one pass
+    times = []
+    for size in sizes:
+        elapsed = measure_time(solver, spec, size, rng, args.repeats)
+        times.append(elapsed)
+        result.sizes.append(size)
+        result.spaces.append(measure_space(solver, spec, size, rng))
+        if elapsed > args.budget:
+            break  # Next doubling would take too long
+    result.times = times
+    bindings = [spec.bind(size) for size in result.sizes]
+
+    # Way slower than the declared bound allows even at the smallest size: a large
+    # asymptotic jump like O(n) -> O(n³) blows the budget before growth can be fitted
+    if result.time.bound is not None and unit is not None:
+        varying = {v for v in exponent_variables(result.time.bound)
+                   if len({b.get(v) for b in bindings}) > 1}
+        steps = result.times[0] / unit / evaluate(to_python(result.time.bound), bindings[0])
+        if not varying and steps > args.max_steps:
+            result.error = (f"{steps:.0f} loop steps per unit of O({result.time.bound}) "
+                            f"at n={result.sizes[0]} (limit {args.max_steps:.0f})")
+            return result
+
+    if len(result.sizes) < 4:
+        result.error = (f"only {len(result.sizes)} size(s) within the {args.budget}s budget, "
+                        f"n={result.sizes[-1]} took {result.times[-1]:.2f}s")
+        return result
+
+    for _ in range(args.passes - 1):
+        result.times = [min(best, measure_time(solver, spec, size, rng, args.repeats))
+                        for best, size in zip(result.times, result.sizes)]
+
+    analyse(result.time, result.sizes, result.times, bindings)
+    analyse(result.space, result.sizes, result.spaces, bindings, args.space_floor, tail=True)
+
+    if result.time.skipped and result.space.skipped:
+        result.skipped = f"time: {result.time.skipped}; space: {result.space.skipped}"
+    return result
+
+
+def check_isolated(name, header, args, known, unit) -> Result:
+    # Runs in a worker process. Every solver gets the same seed, so checking one on its own
+    # with --solvers reproduces its numbers from a full run.
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 100_000))
+    solver = load_solvers(args.file)[name]
+    return check_solver(name, solver, header, args, random.Random(args.seed), known, unit)
+
+
+def report(results: list):
+    def columns(check: Check, width: int) -> str:
+        declared = "-" if check.bound is None else f"O({check.bound})"
+        growth = "     -" if check.growth is None else f"{check.growth:+6.2f}"
+        if check.log_power is None:
+            return f"{declared:<{width}}{growth}{'n/c':>8}{'':>14}"
+        tail = "      -" if check.tail_power is None else f"{check.tail_power:+7.2f}"
+        return f"{declared:<{width}}{growth}{check.log_power:+8.2f}{tail}{min(check.improvement, 999):7.1f}"
+
+    print(f"{'solver':<26}{'declared time':<20}{'fit':>6}{'log^b':>8}{'tail':>7}{'gain':>7}   "
+          f"{'declared space':<18}{'fit':>6}{'log^b':>8}{'tail':>7}{'gain':>7}   status")
+    for r in results:
+        if r.error:
+            print(f"{r.name:<26}ERROR: {r.error}")
+            continue
+        if r.skipped:
+            print(f"{r.name:<26}skipped: {r.skipped}")
+            continue
+
+        if r.unexpected:
+            status = "FLAG " + ", ".join(r.flagged)
+        elif r.flagged:
+            status = "known " + ", ".join(r.flagged) + f": {r.reason}"
+        else:
+            status = "ok"
+        print(f"{r.name:<26}{columns(r.time, 20)}   {columns(r.space, 18)}   {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check solvers against their Time:/Space: annotations")
+    parser.add_argument("--file", default="answers.py")
+    parser.add_argument("--solvers", nargs="+", help="Only check these solvers")
+    parser.add_argument("--min-exp", type=int, default=8, help="Smallest size is 2^min-exp")
+    parser.add_argument("--max-size", type=int, default=2 ** 20)
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per size per pass")
+    parser.add_argument("--passes", type=int, default=3, help="Interleaved passes over all sizes")
+    parser.add_argument("--budget", type=float, default=0.5, help="Stop doubling once a call takes this many seconds")
+    parser.add_argument("--margin", type=float, default=4.0,
+                        help="How many times better the log model must fit than a constant")
+    parser.add_argument("--space-floor", type=float, default=4096, help="Bytes treated as constant overhead")
+    parser.add_argument("--max-steps", type=float, default=1000,
+                        help="Loop steps allowed per unit of the time bound at the smallest size")
+    parser.add_argument("--strict", action="store_true", help="Ignore KNOWN_ISSUES")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    solvers = load_solvers(args.file)
+    headers = load_headers(args.file)
+    names = args.solvers or list(solvers)
+    unknown = set(names) - set(solvers)
+    if unknown:
+        raise SystemExit(f"unknown solver(s) in {args.file}: {', '.join(sorted(unknown))}")
+
+    unit = unit_cost()
+    filename = os.path.basename(os.path.realpath(os.path.join(HERE, args.file)))
+
+    # One fresh process per solver, one at a time: what earlier solvers leave in the heap
+    # slows the largest sizes of later ones, and parallel runs would time each other
+    results = []
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+        for name in names:
+            known = None if args.strict else KNOWN_ISSUES.get((filename, name))
+            results.append(pool.submit(check_isolated, name, headers.get(name, ""), args, known, unit).result())
+    report(results)
+
+    # Non-zero exit on errors and anything not in KNOWN_ISSUES so this can gate a merge
+    sys.exit(1 if any(r.error or (r.unexpected and not r.skipped) for r in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# Sliding Window Aggregation
+# findMaxAverage can slide in O(1) because a sum can be undone by subtraction.
+# max, min, gcd, bitwise or and most other aggregates can't, so recomputing each window
+# costs O(n * k). These queues aggregate a FIFO window in amortized O(1) per step instead.
+from collections import deque
+
+
+# Monotonic Deque (min / max)
+# Time: O(1) amortized per push/popleft, O(1) query | Space: O(k)
+# Keep candidates in decreasing order (increasing for min). A new value evicts every
+# candidate it beats, since those can never be the answer while the new value is in the window.
+class MonotonicQueue:
+    def __init__(self, op=max):
+        if op is not max and op is not min:
+            raise ValueError("MonotonicQueue only supports max or min")
+        self.op = op
+        self.candidates = deque()  # (value, push index)
+        self.pushed = 0
+        self.popped = 0
+
+    def push(self, value):
+        # Drop candidates the new value beats (ties go to the newer one, it lives longer)
+        while self.candidates and self.op(self.candidates[-1][0], value) == value:
+            self.candidates.pop()
+        self.candidates.append((value, self.pushed))
+        self.pushed += 1
+
+    def popleft(self):
+        if not len(self):
+            raise IndexError("popleft from an empty window")
+        # The oldest element is only still stored if it was never beaten
+        if self.candidates[0][1] == self.popped:
+            self.candidates.popleft()
+        self.popped += 1
+
+    def query(self):
+        if not self.candidates:
+            raise IndexError("query on an empty window")
+        return self.candidates[0][0]
+
+    def __len__(self):
+        return self.pushed - self.popped
+
+
+# Two Stacks (any associative operator)
+# Time: O(1) amortized per push/popleft, O(1) query | Space: O(k)
+# Push onto the back stack with a running aggregate. When the front stack runs out, move
+# everything over so each front entry caches the aggregate of itself and every newer front
+# entry. op only has to be associative, not commutative or invertible.
+class TwoStackQueue:
+    def __init__(self, op):
+        self.op = op
+        self.front = []  # (value, aggregate from this value to the back of the front stack)
+        self.back = []
+        self.back_agg = None
+
+    def push(self, value):
+        self.back_agg = value if not self.back else self.op(self.back_agg, value)
+        self.back.append(value)
+
+    def popleft(self):
+        if not self.front:
+            if not self.back:
+                raise IndexError("popleft from an empty window")
+            # Newest first, so each entry's aggregate covers everything after it
+            while self.back:
+                value = self.back.pop()
+                agg = value if not self.front else self.op(value, self.front[-1][1])
+                self.front.append((value, agg))
+            self.back_agg = None
+        self.front.pop()
+
+    def query(self):
+        if self.front and self.back:
+            return self.op(self.front[-1][1], self.back_agg)
+        if self.front:
+            return self.front[-1][1]
+        if self.back:
+            return self.back_agg
+        raise IndexError("query on an empty window")
+
+    def __len__(self):
+        return len(self.front) + len(self.back)
+
+
+def make_window(op):
+    # min/max get the monotonic deque, everything else the two-stack queue
+    if op is max or op is min:
+        return MonotonicQueue(op)
+    return TwoStackQueue(op)
+
+
+# Fixed-size windows
+# Time: O(n) | Space: O(k)
+# Yields the aggregate of nums[i:i + k] for every i, like findMaxAverage's window.
+def sliding_aggregate(nums, k: int, op=max):
+    if k <= 0:
+        raise ValueError("window size k must be positive")
+
+    window = make_window(op)
+    for right, num in enumerate(nums):
+        window.push(num)
+        if len(window) > k:
+            window.popleft()
+        if right >= k - 1:
+            yield window.query()
+
+
+def sliding_aggregate_array(nums, k: int, op=max) -> list:
+    return list(sliding_aggregate(nums, k, op))
+
+
+# Variable-size windows
+# Time: O(n + w) | Space: O(max window) where w is the number of windows
+# Yields the aggregate of nums[left:right + 1] for each (left, right) in bounds. Both ends may
+# only move forward, which is how longestOnes grows and shrinks its window.
+def window_aggregate(nums, bounds, op=max):
+    window = make_window(op)
+    left = right = 0  # Window currently holds nums[left:right]
+
+    for lo, hi in bounds:
+        if lo < left or hi + 1 < right or lo > hi:
+            raise ValueError(f"window ({lo}, {hi}) moves backwards from ({left}, {right - 1})")
+
+        # Expand the window
+        while right <= hi:
+            window.push(nums[right])
+            right += 1
+
+        # Shrink it from the left
+        while left < lo:
+            window.popleft()
+            left += 1
+
+        yield window.query()
+
+
+def window_aggregate_array(nums, bounds, op=max) -> list:
+    return list(window_aggregate(nums, bounds, op))
+
+
+# Longest valid window
+# Time: O(n) | Space: O(n) worst case
+# longestOnes with the zero count swapped for any aggregate. valid(aggregate) must stay true
+# when a window shrinks, e.g. longest_window(nums, math.gcd, lambda g: g > 1).
+def longest_window(nums, op, valid) -> int:
+    window = make_window(op)
+    length = 0
+
+    for num in nums:
+        window.push(num)
+
+        # Shrink the window until it is valid again
+        while len(window) and not valid(window.query()):
+            window.popleft()
+
+        length = max(length, len(window))
+
+    return length
+
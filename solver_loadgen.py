@@ -0,0 +1,143 @@
+# Solver Service Load Generator
+# Fires concurrent requests at solver_service.py and reports throughput and p50/p90/p99 latency.
+#
+# Usage:
+#   python solver_loadgen.py --spawn                      # start a service subprocess and load it
+#   python solver_loadgen.py --unix /tmp/solvers.sock --concurrency 256 --duration 10
+#   python solver_loadgen.py --spawn --solvers rob climbStairs --size 5000
+import argparse
+import asyncio
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+from solver_service import SolverClient, SolverError, add_address_args
+
+SERVICE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "solver_service.py")
+
+
+# Request payloads per solver, scaled by --size
+def make_payloads(size: int) -> dict:
+    return {
+        "climbStairs": lambda: [random.randint(1, size)],
+        "rob": lambda: [[random.randint(0, 400) for _ in range(size)]],
+        "searchRange": lambda: [sorted(random.randint(0, size // 4) for _ in range(size)),
+                                random.randint(0, size // 4)],
+        "maxProfit": lambda: [[random.randint(1, 10_000) for _ in range(size)]],
+        "threeSum": lambda: [[random.randint(-size, size) for _ in range(min(size, 300))]],
+    }
+
+
+# Nearest-rank percentile over an already sorted list
+def percentile(ordered: list[float], p: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, math.ceil(p / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+async def worker(client, solvers, payloads, deadline, latencies, errors):
+    while time.perf_counter() < deadline:
+        name = random.choice(solvers)
+        args = payloads[name]()
+
+        start = time.perf_counter()
+        try:
+            await client.call(name, *args)
+        except SolverError:
+            errors.append(name)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+async def spawn_service(args):
+    # Separate process so the service's latency doesn't include this client's scheduling
+    args.unix = args.unix or os.path.join(tempfile.mkdtemp(), "solvers.sock")
+    if os.path.exists(args.unix):
+        os.unlink(args.unix)
+
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, SERVICE, "serve", "--unix", args.unix,
+        "--executor", args.executor, "--workers", str(args.workers),
+        "--max-batch", str(args.max_batch), "--max-delay-ms", str(args.max_delay_ms),
+        stdout=asyncio.subprocess.DEVNULL)
+
+    # Wait for the socket to appear
+    deadline = time.perf_counter() + 30
+    while not os.path.exists(args.unix):
+        if process.returncode is not None:
+            raise SystemExit(f"solver service exited with status {process.returncode}")
+        if time.perf_counter() > deadline:
+            process.kill()
+            raise SystemExit("solver service did not start within 30s")
+        await asyncio.sleep(0.05)
+
+    return process
+
+
+async def run(args):
+    server = None
+    if args.spawn:
+        server = await spawn_service(args)
+
+    # Pre-build a pool of payloads so request generation doesn't dominate the client
+    templates = make_payloads(args.size)
+    unknown = set(args.solvers) - set(templates)
+    if unknown:
+        raise SystemExit(f"no payload generator for: {', '.join(sorted(unknown))}")
+    pools = {name: [templates[name]() for _ in range(64)] for name in args.solvers}
+    payloads = {name: (lambda pool=pool: random.choice(pool)) for name, pool in pools.items()}
+
+    clients = [await SolverClient.connect(unix=args.unix, host=args.host, port=args.port)
+               for _ in range(args.connections)]
+    latencies = []
+    errors = []
+
+    try:
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(
+            worker(clients[i % len(clients)], args.solvers, payloads, deadline, latencies, errors)
+            for i in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - start
+    finally:
+        for client in clients:
+            await client.close()
+        if server is not None:
+            server.terminate()
+            await server.wait()
+
+    latencies.sort()
+    ms = [latency * 1000 for latency in latencies]
+    print(f"solvers:     {', '.join(args.solvers)} (size={args.size})")
+    print(f"concurrency: {args.concurrency} over {args.connections} connection(s)")
+    print(f"requests:    {len(latencies)} ok, {len(errors)} errors in {elapsed:.2f}s")
+    print(f"throughput:  {len(latencies) / elapsed:.0f} req/s")
+    print(f"latency ms:  p50={percentile(ms, 50):.2f}  p90={percentile(ms, 90):.2f}  "
+          f"p99={percentile(ms, 99):.2f}  max={ms[-1] if ms else 0:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for solver_service.py")
+    add_address_args(parser)
+    parser.add_argument("--spawn", action="store_true", help="Start a service in a subprocess")
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread",
+                        help="Executor for --spawn")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Workers for --spawn")
+    parser.add_argument("--max-batch", type=int, default=64, help="Batch size for --spawn")
+    parser.add_argument("--max-delay-ms", type=float, default=2.0, help="Batch window for --spawn")
+    parser.add_argument("--solvers", nargs="+", default=["searchRange", "rob", "climbStairs"])
+    parser.add_argument("--size", type=int, default=1000, help="Input size per request")
+    parser.add_argument("--concurrency", type=int, default=64, help="Requests in flight")
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds to run")
+
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+# Solver Service
+# asyncio server that runs the answers.py solvers by name over a Unix socket or localhost TCP.
+# Concurrent requests for the same solver are coalesced into micro-batches, and every batch
+# runs in an executor so the event loop never blocks on a CPU-heavy call.
+#
+# Protocol: one JSON object per line, responses may come back out of order
+#   request:  {"id": 1, "solver": "rob", "args": [[2, 7, 9, 3, 1]]}
+#   response: {"id": 1, "result": 12}   or   {"id": 1, "error": "..."}
+#
+# Usage:
+#   python solver_service.py serve --unix /tmp/solvers.sock
+#   python solver_service.py serve --port 8765 --executor process --workers 4
+#   python solver_service.py call --unix /tmp/solvers.sock rob '[[2, 7, 9, 3, 1]]'
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import signal
+import sys
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from solvers import load_solvers
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+STREAM_LIMIT = 16 * 1024 * 1024  # Longest request/response line in bytes
+
+# climbStairs(n) has ~0.2n digits, past Python's default 4300-digit int <-> str limit around
+# n = 20,500. Lines are already capped by STREAM_LIMIT, so lift the per-int limit for both
+# encoding results and decoding them in the client.
+if hasattr(sys, "set_int_max_str_digits"):
+    sys.set_int_max_str_digits(0)
+
+
+class SolverError(Exception):
+    pass
+
+
+# Batch Kernels
+# A kernel answers a whole batch at once, cheaper than calling the solver per request.
+# Each takes a list of argument lists and returns one result per request.
+
+# Time: O(max n + b) | Space: O(1) extra
+# Every request is a prefix of the same Fibonacci walk, so walk once up to the largest n.
+def climb_stairs_batch(calls: list[list]) -> list[int]:
+    wanted = {}
+    for i, (n,) in enumerate(calls):
+        wanted.setdefault(n, []).append(i)
+
+    # Anything but an int goes back to the per-request path so errors match climbStairs
+    if any(type(n) is not int for n in wanted):
+        raise TypeError("climbStairs batch only takes integers")
+
+    results = [0] * len(calls)
+    step = 2
+    prev2, prev1 = 1, 2  # Ways to reach step 1 and step 2
+
+    for n in sorted(wanted):
+        if n <= 2:
+            value = n
+        else:
+            # Continue the walk from wherever the previous (smaller) n stopped
+            while step < n:
+                prev2, prev1 = prev1, prev1 + prev2
+                step += 1
+            value = prev1
+
+        for i in wanted[n]:
+            results[i] = value
+
+    return results
+
+
+# Time: O(b * n) for sorted input | Space: O(n) extra
+# Both boundaries come from C-level bisect instead of two interpreted binary searches per request.
+# Bisect only agrees with searchRange on sorted input, so anything else goes to the solver.
+# The sortedness check is O(n) but runs in C, and decoding the request was O(n) already.
+def search_range_batch(calls: list[list]) -> list[list[int]]:
+    results = []
+    for nums, target in calls:
+        if nums != sorted(nums):
+            results.append(_get_solvers()["searchRange"](nums, target))
+            continue
+
+        first = bisect_left(nums, target)
+        if first == len(nums) or nums[first] != target:
+            results.append([-1, -1])
+        else:
+            results.append([first, bisect_right(nums, target) - 1])
+
+    return results
+
+
+BATCH_KERNELS = {
+    "climbStairs": climb_stairs_batch,
+    "searchRange": search_range_batch,
+}
+
+_solvers = None
+
+
+def _get_solvers() -> dict:
+    # Loaded lazily so each process pool worker builds its own registry
+    global _solvers
+    if _solvers is None:
+        _solvers = load_solvers()
+    return _solvers
+
+
+def run_batch(name: str, calls: list[list]) -> list[tuple[bool, object]]:
+    # Runs inside the executor. Returns (ok, result or error message) per request.
+    kernel = BATCH_KERNELS.get(name)
+    if kernel is not None:
+        try:
+            return [(True, result) for result in kernel(calls)]
+        except Exception:
+            pass  # Fall back to one call per request so a bad input only fails itself
+
+    solver = _get_solvers()[name]
+    results = []
+    for args in calls:
+        try:
+            results.append((True, solver(*args)))
+        except Exception as e:
+            results.append((False, f"{type(e).__name__}: {e}"))
+    return results
+
+
+class MicroBatcher:
+    # Collects requests for one solver until max_batch arrive or max_delay passes,
+    # then ships them to the executor as a single job.
+    def __init__(self, name: str, executor, max_batch: int, max_delay: float):
+        self.name = name
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.pending = []  # (dedupe key, args, future)
+        self.timer = None
+        self.tasks = set()  # Running batches, kept so they aren't garbage-collected mid-flight
+
+    def submit(self, key: str, args: list) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((key, args, future))
+
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.max_delay, self.flush)
+
+        return future
+
+    def flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if not self.pending:
+            return
+
+        batch, self.pending = self.pending, []
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _run(self, batch: list):
+        # Identical requests in the same batch are only solved once
+        index = {}
+        calls = []
+        for key, args, _ in batch:
+            if key not in index:
+                index[key] = len(calls)
+                calls.append(args)
+
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self.executor, run_batch, self.name, calls)
+        except asyncio.CancelledError:
+            fail(batch, "solver service is shutting down")
+            raise
+        except Exception as e:
+            results = [(False, f"{type(e).__name__}: {e}")] * len(calls)
+
+        for key, _, future in batch:
+            if future.done():
+                continue
+            ok, value = results[index[key]]
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(SolverError(value))
+
+    async def close(self):
+        # Fail whatever is still waiting for the next flush, then stop running batches
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        fail(batch, "solver service is shutting down")
+
+        tasks = list(self.tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def fail(batch: list, message: str):
+    for _, _, future in batch:
+        if not future.done():
+            future.set_exception(SolverError(message))
+
+
+class SolverServer:
+    def __init__(self, executor=None, max_batch: int = 64, max_delay: float = 0.002):
+        self.executor = executor or ThreadPoolExecutor(max_workers=1)
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.names = set(_get_solvers())
+        self.batchers = {}
+        self.server = None
+
+    async def start(self, unix: str = None, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        if unix:
+            if os.path.exists(unix):
+                os.unlink(unix)
+            self.server = await asyncio.start_unix_server(self._handle, path=unix, limit=STREAM_LIMIT)
+        else:
+            self.server = await asyncio.start_server(self._handle, host, port, limit=STREAM_LIMIT)
+        return self.server
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for batcher in self.batchers.values():
+            await batcher.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _batcher(self, name: str) -> MicroBatcher:
+        if name not in self.batchers:
+            self.batchers[name] = MicroBatcher(name, self.executor, self.max_batch, self.max_delay)
+        return self.batchers[name]
+
+    async def _handle(self, reader, writer):
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                task = asyncio.create_task(self._respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass  # Dropped connection or a line longer than STREAM_LIMIT
+        except asyncio.CancelledError:
+            pass  # Shutting down with the connection still open
+        finally:
+            # Let in-flight requests finish (or fail) before the connection goes away
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            writer.close()
+
+    async def _respond(self, line: bytes, writer):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            name = request.get("solver")
+            args = request.get("args", [])
+
+            if not isinstance(name, str) or name not in self.names:
+                raise SolverError(f"unknown solver: {name!r}")
+            if not isinstance(args, list):
+                raise SolverError("args must be a list")
+
+            key = json.dumps(args, separators=(",", ":"))
+            response = {"id": request_id, "result": await self._batcher(name).submit(key, args)}
+        except SolverError as e:
+            response = {"id": request_id, "error": str(e)}
+        except (ValueError, AttributeError, TypeError) as e:
+            response = {"id": request_id, "error": f"bad request: {e}"}
+        except Exception as e:
+            # Every parsed request gets an answer, or the client would wait forever
+            response = {"id": request_id, "error": f"{type(e).__name__}: {e}"}
+
+        try:
+            payload = json.dumps(response, separators=(",", ":"))
+        except (TypeError, ValueError) as e:
+            payload = json.dumps({"id": request_id, "error": f"result is not JSON serializable: {e}"})
+
+        writer.write(payload.encode() + b"\n")
+        await writer.drain()
+
+
+class SolverClient:
+    # Pipelined client: many calls can be in flight on one connection at once
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.ids = itertools.count()
+        self.waiting = {}
+        self.listener = asyncio.create_task(self._listen())
+
+    @classmethod
+    async def connect(cls, unix: str = None, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        if unix:
+            reader, writer = await asyncio.open_unix_connection(unix, limit=STREAM_LIMIT)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=STREAM_LIMIT)
+        return cls(reader, writer)
+
+    async def call(self, solver: str, *args):
+        request_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[request_id] = future
+
+        request = {"id": request_id, "solver": solver, "args": list(args)}
+        self.writer.write(json.dumps(request, separators=(",", ":")).encode() + b"\n")
+        await self.writer.drain()
+
+        return await future
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.listener.cancel()
+
+    async def _listen(self):
+        try:
+            while line := await self.reader.readline():
+                response = json.loads(line)
+                future = self.waiting.pop(response.get("id"), None)
+                if future is None or future.done():
+                    continue
+                if "error" in response:
+                    future.set_exception(SolverError(response["error"]))
+                else:
+                    future.set_result(response["result"])
+        finally:
+            # Connection gone: fail anything still waiting
+            for future in self.waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("solver service closed the connection"))
+            self.waiting.clear()
+
+
+def make_executor(kind: str, workers: int):
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers, initializer=_get_solvers)
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def add_address_args(parser):
+    parser.add_argument("--unix", help="Unix socket path (default: localhost TCP)")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+
+
+async def serve(args):
+    server = SolverServer(make_executor(args.executor, args.workers),
+                          max_batch=args.max_batch, max_delay=args.max_delay_ms / 1000)
+    await server.start(unix=args.unix, host=args.host, port=args.port)
+    print(f"serving {len(server.names)} solvers on {args.unix or f'{args.host}:{args.port}'}")
+
+    # SIGTERM (e.g. from solver_loadgen.py --spawn) shuts down like Ctrl+C. Dying outright
+    # would orphan process-pool workers, which never see their task queue close.
+    stop = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    except NotImplementedError:
+        pass  # No loop signal handlers on Windows
+    try:
+        await stop.wait()
+    finally:
+        await server.close()
+
+
+async def call_once(args):
+    client = await SolverClient.connect(unix=args.unix, host=args.host, port=args.port)
+    try:
+        print(json.dumps(await client.call(args.solver, *json.loads(args.args))))
+    except SolverError as e:
+        raise SystemExit(f"error: {e}")
+    finally:
+        await client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local micro-batching solver service")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="Run the service")
+    add_address_args(serve_parser)
+    serve_parser.add_argument("--executor", choices=["thread", "process"], default="thread")
+    serve_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    serve_parser.add_argument("--max-batch", type=int, default=64)
+    serve_parser.add_argument("--max-delay-ms", type=float, default=2.0)
+
+    call_parser = commands.add_parser("call", help="Send one request and print the result")
+    add_address_args(call_parser)
+    call_parser.add_argument("solver")
+    call_parser.add_argument("args", help="JSON list of positional arguments")
+
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args) if args.command == "serve" else call_once(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
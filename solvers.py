@@ -0,0 +1,62 @@
+# Solver Registry
+# answers.py redefines `class Solution` for every problem, so importing it only
+# leaves the last one. Compile each Solution class on its own and index its
+# methods by name instead.
+import ast
+import os
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_solvers(filename: str = "answers.py") -> dict:
+    path = os.path.join(HERE, filename)
+    with open(path) as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    # Every top-level import is shared by all classes in the file
+    imports = [node for node in tree.body
+               if isinstance(node, (ast.Import, ast.ImportFrom))]
+    shared = {"__name__": os.path.splitext(filename)[0]}
+    exec(compile(ast.Module(body=imports, type_ignores=[]), path, "exec"), shared)
+
+    solvers = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef) or node.name != "Solution":
+            continue
+
+        namespace = dict(shared)
+        exec(compile(ast.Module(body=[node], type_ignores=[]), path, "exec"), namespace)
+        instance = namespace["Solution"]()
+
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef) and not item.name.startswith("_"):
+                solvers[item.name] = getattr(instance, item.name)
+
+    return solvers
+
+
+def load_headers(filename: str = "answers.py") -> dict:
+    # The comment block above each Solution class, e.g. "Time: O(n) | Space: O(1)"
+    path = os.path.join(HERE, filename)
+    with open(path) as f:
+        source = f.read()
+    lines = source.splitlines()
+
+    headers = {}
+    previous_end = 0  # Last line of the previous class, comments after it belong to the next
+    for node in ast.parse(source, filename=path).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+
+        comments = [line.strip().lstrip("#").strip()
+                    for line in lines[previous_end:node.lineno - 1]
+                    if line.strip().startswith("#")]
+        previous_end = node.end_lineno
+
+        if node.name != "Solution":
+            continue
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef) and not item.name.startswith("_"):
+                headers[item.name] = "\n".join(comments)
+
+    return headers